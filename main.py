@@ -1,159 +1,354 @@
 import asyncio
+import functools
 import aiohttp
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+import psutil
+import xxhash
+from aiolimiter import AsyncLimiter
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import quote, unquote, urljoin, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
 import os
+import io
 import re
 import sys
+import tarfile
+import time
 from collections import deque
 import traceback
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+if sys.platform == 'win32':
+    import winloop as uvloop
+else:
+    import uvloop
 
-print("Enter Starting URL such as https://rezero.fandom.com/wiki/World_Timeline\n\n")
-user_input = input("Starting URL:" )
-BASE_URL = user_input.split("fandom.com")[0] + "fandom.com"
-START_PATH = user_input.split("fandom.com")[1]
 DUMP_DIR = './dump'
+ARCHIVE_NAME_FORMAT = 'dump-%Y%m%d-%H%M%S.tar'
+ARCHIVE_BATCH_SIZE = 50
 
-MAX_CONCURRENT_WORKERS = os.cpu_count() // 3
 REQUEST_LIMIT = 5
+MAX_REQUEST_LIMIT = 20
+MAX_CONCURRENT_WORKERS = MAX_REQUEST_LIMIT
+PARSER_COUNT = os.cpu_count() or 4
+REQUESTS_PER_SECOND = 10
+POOL_ADJUST_INTERVAL = 5
 REQUEST_TIMEOUT = 30
+RETRY_ATTEMPTS = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_BACKOFF = 2
+MAX_RETRY_DELAY = 120
+MAX_PAGE_BYTES = 5 * 1024 * 1024
 USER_AGENT = 'FandomWikiArchiver/1.0 (Purpose: personal offline use)'
 
+_FNAME_RE = re.compile(r'[\\/*?:"<>|]')
+_BAD_NS_RE = re.compile(
+    r'^/wiki/(Special|File|Category|User|User_blog|Template|Help|MediaWiki|Talk|Forum|Board):'
+)
+
+_SKIP_HREF_PREFIXES = ('#', 'mailto:', 'javascript:')
+_SKIP_HREF_SUFFIXES = ('.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp')
+
+_STRIP_SELECTOR = 'script, style, nav, aside, figure, table.infobox, div.toc, div.navbox, .mw-editsection'
+
 os.makedirs(DUMP_DIR, exist_ok=True)
 
+def is_valid_url(url, base_netloc):
+    parsed = urlparse(url)
+    if parsed.netloc != base_netloc:
+        return False
+    if not parsed.path.startswith('/wiki/'):
+        return False
+    if _BAD_NS_RE.match(parsed.path):
+        return False
+    if 'action=edit' in parsed.query or 'action=history' in parsed.query:
+        return False
+    return True
+
+def normalize_link(href, current_url, base_url, base_netloc):
+    if href.startswith(_SKIP_HREF_PREFIXES):
+        return None
+    # Hrefs with dot segments take the urljoin path so they are resolved
+    # before the namespace check, exactly as the slow path would.
+    if href.startswith('/wiki/') and '/.' not in href:
+        link_path = href.split('#', 1)[0]
+        path, _, query = link_path.partition('?')
+        if _BAD_NS_RE.match(path):
+            return None
+        if 'action=edit' in query or 'action=history' in query:
+            return None
+        return base_url + link_path
+    if href.lower().endswith(_SKIP_HREF_SUFFIXES):
+        return None
+
+    # Absolute and protocol-relative links resolve the same from any page,
+    # so key them on base_url to share cache entries across pages.
+    if href.startswith(('http:', 'https:', '//')):
+        return _resolve_link(base_url, href, base_netloc)
+    return _resolve_link(current_url, href, base_netloc)
+
+@functools.lru_cache(maxsize=100_000)
+def _resolve_link(base, href, base_netloc):
+    absolute_url = urljoin(base, href)
+    cleaned_url = urlparse(absolute_url)._replace(fragment="").geturl()
+    if is_valid_url(cleaned_url, base_netloc):
+        return cleaned_url
+    return None
+
+# Runs in a ProcessPoolExecutor worker, so it must stay a picklable
+# module-level function that only touches its arguments.
+def parse_page(html_content, current_url, base_url, base_netloc):
+    tree = LexborHTMLParser(html_content)
+    content_div = tree.css_first('div.mw-parser-output') or tree.css_first('#mw-content-text')
+    if not content_div:
+        return None, []
+
+    # Collect links before stripping: infoboxes and navboxes are noise in the
+    # saved text but carry most of the links between articles.
+    new_links = []
+    for link in content_div.css('a[href]'):
+        href = link.attrs.get('href')
+        if not href:
+            continue
+        cleaned_url = normalize_link(href, current_url, base_url, base_netloc)
+        if cleaned_url:
+            new_links.append(cleaned_url)
+
+    for tag in content_div.css(_STRIP_SELECTOR):
+        tag.decompose()
+
+    text = content_div.text(separator='\n', strip=True)
+    text = '\n'.join(' '.join(line.split()) for line in text.splitlines() if line.strip())
+
+    return text, new_links
+
+def retry_delay(retry_after, attempt):
+    if retry_after:
+        if retry_after.isdigit():
+            return min(int(retry_after), MAX_RETRY_DELAY)
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            remaining = (retry_at - datetime.now(timezone.utc)).total_seconds()
+            return min(max(remaining, 0), MAX_RETRY_DELAY)
+        except (TypeError, ValueError):
+            pass
+    return min(RETRY_BACKOFF * 2 ** attempt, MAX_RETRY_DELAY)
+
+class AdaptivePool:
+    def __init__(self, initial_limit, max_limit, adjust_interval):
+        self.limit = initial_limit
+        self.max_limit = max_limit
+        self.adjust_interval = adjust_interval
+        self._active = 0
+        self._condition = asyncio.Condition()
+        self._requests = 0
+        self._errors = 0
+        self._last_adjust = time.monotonic()
+        psutil.cpu_percent(interval=None)
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify(max(self.limit - self._active, 0))
+
+    def record(self, ok):
+        self._requests += 1
+        if not ok:
+            self._errors += 1
+
+        now = time.monotonic()
+        if now - self._last_adjust < self.adjust_interval:
+            return
+        error_rate = self._errors / self._requests
+        if error_rate >= 0.01:
+            self.limit = max(self.limit // 2, 1)
+            print(f"Backing off to {self.limit} concurrent requests (error rate {error_rate:.1%})", file=sys.stderr)
+        elif psutil.cpu_percent(interval=None) < 80:
+            self.limit = min(self.limit + 1, self.max_limit)
+        # Otherwise the parsers are saturating the CPU; more fetches would
+        # only queue up behind them, so hold the current limit.
+        self._requests = 0
+        self._errors = 0
+        self._last_adjust = now
+
 class URLManager:
     def __init__(self, start_url):
         self.urls_to_visit = deque([start_url])
-        self.visited_urls = {start_url}
-        self._lock = asyncio.Lock()
-
-    async def get_next_url(self):
-        async with self._lock:
-            if self.urls_to_visit:
-                return self.urls_to_visit.popleft()
-            return None
+        self.visited = {xxhash.xxh64_intdigest(start_url.encode())}
+        self._in_progress = 0
+        self._changed = asyncio.Event()
+
+    # Only ever called from coroutines on the event loop thread, and none of
+    # these methods await between checking and mutating state, so no lock is
+    # needed to keep the queue, set and counter consistent.
+    def get_next_url(self):
+        if self.urls_to_visit:
+            self._in_progress += 1
+            return self.urls_to_visit.popleft()
+        return None
 
-    async def add_new_urls(self, urls):
-        async with self._lock:
-            new_urls_added = 0
-            for url in urls:
-                if url not in self.visited_urls:
-                    self.visited_urls.add(url)
-                    self.urls_to_visit.append(url)
-                    new_urls_added += 1
-            return new_urls_added
+    async def wait_for_url(self):
+        while True:
+            url = self.get_next_url()
+            if url is not None or self._in_progress == 0:
+                return url
+            self._changed.clear()
+            await self._changed.wait()
+
+    def task_done(self):
+        self._in_progress -= 1
+        self._changed.set()
+
+    def add_new_urls(self, urls):
+        by_hash = {xxhash.xxh64_intdigest(url.encode()): url for url in urls}
+        new_hashes = [url_hash for url_hash in by_hash if url_hash not in self.visited]
+        self.visited.update(new_hashes)
+        self.urls_to_visit.extend(by_hash[url_hash] for url_hash in new_hashes)
+        if new_hashes:
+            self._changed.set()
+        return len(new_hashes)
 
     def get_queue_size(self):
         return len(self.urls_to_visit)
 
     def get_visited_count(self):
-        return len(self.visited_urls)
+        return len(self.visited)
 
 class WikiScraper:
-    def __init__(self, base_url, dump_dir, user_agent, executor):
+    def __init__(self, base_url, user_agent, executor):
         self.base_url = base_url
-        self.dump_dir = dump_dir
+        self._base_netloc = urlparse(base_url).netloc
         self.user_agent = user_agent
         self.robot_parser = RobotFileParser()
+        self._robots_re = None
+        self._robots_allowances = []
         self.executor = executor
-
-    async def setup_robots_parser(self):
+        self.content_hashes = set()
+        self.write_queue = asyncio.Queue(maxsize=4 * ARCHIVE_BATCH_SIZE)
+        self.request_pool = AdaptivePool(REQUEST_LIMIT, MAX_REQUEST_LIMIT, POOL_ADJUST_INTERVAL)
+        self.rate_limiter = AsyncLimiter(REQUESTS_PER_SECOND, 1)
+
+    # Follows RFC 9309 section 2.3.1: a 4xx robots.txt means no rules apply,
+    # while a 5xx or unreachable one means assume complete disallow. Returns
+    # whether the crawl may go ahead.
+    async def setup_robots_parser(self, session):
         robots_url = urljoin(self.base_url, '/robots.txt')
         print(f"Fetching robots.txt from: {robots_url}")
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(robots_url, headers={'User-Agent': self.user_agent}) as response:
-                    if response.status == 200:
-                        lines = (await response.text()).splitlines()
-                        self.robot_parser.parse(lines)
-                        print("Successfully fetched and parsed robots.txt")
-                    else:
-                        print(f"Warning: Could not fetch robots.txt (Status: {response.status}). Proceeding without checks.", file=sys.stderr)
+            async with session.get(robots_url) as response:
+                if response.status == 200:
+                    lines = (await response.text()).splitlines()
+                    self.robot_parser.parse(lines)
+                    self._compile_robots_rules()
+                    print("Successfully fetched and parsed robots.txt")
+                    return True
+                if 400 <= response.status < 500:
+                    print(f"Warning: No robots.txt (Status: {response.status}). Proceeding without checks.", file=sys.stderr)
+                    return True
+                print(f"Error: robots.txt is unavailable (Status: {response.status}). Not crawling.", file=sys.stderr)
         except Exception as e:
-            print(f"Warning: Could not fetch or parse robots.txt: {e}", file=sys.stderr)
-            print("Proceeding without robots.txt checks - Be extra cautious!", file=sys.stderr)
-
-    def is_valid_url(self, url):
-        parsed = urlparse(url)
-        if parsed.netloc != urlparse(self.base_url).netloc:
-            return False
-        if not parsed.path.startswith('/wiki/'):
-            return False
-        if any(prefix in parsed.path for prefix in [
-            '/wiki/Special:', '/wiki/File:', '/wiki/Category:', '/wiki/User:',
-            '/wiki/User_blog:', '/wiki/Template:', '/wiki/Help:', '/wiki/MediaWiki:',
-            '/wiki/Talk:', '/wiki/Forum:', '/wiki/Board:'
-        ]):
-            return False
-        if 'action=edit' in parsed.query or 'action=history' in parsed.query:
-            return False
-        return True
+            print(f"Error: Could not fetch or parse robots.txt: {e}. Not crawling.", file=sys.stderr)
+        return False
+
+    def _compile_robots_rules(self):
+        entry = next(
+            (e for e in self.robot_parser.entries if e.applies_to(self.user_agent)),
+            self.robot_parser.default_entry,
+        )
+        if entry is None or not entry.rulelines:
+            return
+
+        # Longest rule first, so the first alternative that matches is the
+        # most specific one and lastindex points at its allowance.
+        rules = sorted(entry.rulelines, key=lambda line: len(line.path), reverse=True)
+        self._robots_allowances = [line.allowance for line in rules]
+        self._robots_re = re.compile('|'.join(
+            '()' if line.path == '*' else f'({re.escape(line.path)})' for line in rules
+        ))
+
+    def can_fetch(self, url):
+        if self._robots_re is None:
+            return True
+        parsed = urlparse(unquote(url))
+        path = quote(urlunparse(('', '', parsed.path, parsed.params, parsed.query, parsed.fragment))) or '/'
+        match = self._robots_re.match(path)
+        return match is None or self._robots_allowances[match.lastindex - 1]
 
     def url_to_filename(self, url):
         parsed = urlparse(url)
         path = parsed.path.replace('/wiki/', '', 1).replace('/', '_')
-        filename = re.sub(r'[\\/*?:"<>|]', '_', path) or 'index'
-        return os.path.join(self.dump_dir, f"{filename[:200]}.txt")
+        filename = _FNAME_RE.sub('_', path) or 'index'
+        return f"{filename[:200]}.txt"
 
     async def fetch_page(self, session, url):
-        if not self.robot_parser.can_fetch(self.user_agent, url):
+        if not self.can_fetch(url):
             return None
-        try:
-            async with session.get(url, headers={'User-Agent': self.user_agent}, timeout=REQUEST_TIMEOUT) as response:
-                response.raise_for_status()
-                return await response.text()
-        except aiohttp.ClientError as e:
-            print(f"Error fetching {url}: {e}", file=sys.stderr)
-        except asyncio.TimeoutError:
-            print(f"Timeout error fetching {url}", file=sys.stderr)
-        except Exception as e:
-            print(f"An unexpected error occurred fetching {url}: {e}", file=sys.stderr)
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                async with self.request_pool, self.rate_limiter:
+                    async with session.get(url) as response:
+                        self.request_pool.record(response.status not in RETRY_STATUSES)
+                        if response.status not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS - 1:
+                            response.raise_for_status()
+                            return await self._read_body(response, url)
+                        delay = retry_delay(response.headers.get('Retry-After'), attempt)
+                        print(f"HTTP {response.status} for {url}, retrying in {delay:.0f}s", file=sys.stderr)
+            except aiohttp.ClientConnectionError as e:
+                self.request_pool.record(False)
+                print(f"Error fetching {url}: {e}", file=sys.stderr)
+                return None
+            except aiohttp.ClientError as e:
+                print(f"Error fetching {url}: {e}", file=sys.stderr)
+                return None
+            except asyncio.TimeoutError:
+                self.request_pool.record(False)
+                print(f"Timeout error fetching {url}", file=sys.stderr)
+                return None
+            except Exception as e:
+                print(f"An unexpected error occurred fetching {url}: {e}", file=sys.stderr)
+                return None
+            # Sleep outside the pool slot so the backoff doesn't hold back other requests.
+            await asyncio.sleep(delay)
         return None
 
-    def _parse_and_save(self, html_content, current_url):
-
-        soup = BeautifulSoup(html_content, 'html.parser')
-        content_div = soup.find('div', class_='mw-parser-output') or soup.find('div', id='mw-content-text')
-        if not content_div:
-            return None, []
-
-        for tag in content_div.find_all(['script', 'style', 'nav', 'table.infobox', 'div.toc', 'figure', 'aside']):
-            if tag:
-                tag.decompose()
-
-        text = content_div.get_text(separator='\n', strip=True)
-        text = re.sub(r'\n\s*\n', '\n', text)
-        text = re.sub(r' +', ' ', text)
+    async def _read_body(self, response, url):
+        if 'html' not in response.headers.get('Content-Type', ''):
+            return None
+        if response.content_length and response.content_length > MAX_PAGE_BYTES:
+            print(f"Skipping oversized page {url} ({response.content_length} bytes)", file=sys.stderr)
+            return None
 
-        filename = self.url_to_filename(current_url)
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(text)
-            print(f"Successfully saved text to: {os.path.basename(filename)}")
-        except IOError as e:
-            print(f"Error saving file {filename}: {e}", file=sys.stderr)
-
-        new_links = []
-        for link in content_div.find_all('a', href=True):
-            absolute_url = urljoin(current_url, link['href'])
-            cleaned_url = urlparse(absolute_url)._replace(fragment="").geturl()
-            if self.is_valid_url(cleaned_url):
-                new_links.append(cleaned_url)
-
-        return text, new_links
-
-    async def process_page(self, session, url):
-        html = await self.fetch_page(session, url)
-        if not html:
-            return 0
+        body = bytearray()
+        async for chunk in response.content.iter_any():
+            body += chunk
+            if len(body) > MAX_PAGE_BYTES:
+                print(f"Skipping oversized page {url} (over {MAX_PAGE_BYTES} bytes)", file=sys.stderr)
+                return None
+        return body.decode(response.charset or 'utf-8', errors='replace')
 
+    async def process_page(self, html, url):
         loop = asyncio.get_running_loop()
         try:
-            _, new_links = await loop.run_in_executor(
-                self.executor, self._parse_and_save, html, url
+            text, new_links = await loop.run_in_executor(
+                self.executor, parse_page, html, url, self.base_url, self._base_netloc
             )
+            if text is None:
+                return new_links
+
+            content_hash = xxhash.xxh3_128_intdigest(text.encode())
+            if content_hash in self.content_hashes:
+                print(f"Skipping duplicate content: {url}")
+                return new_links
+            self.content_hashes.add(content_hash)
+
+            await self.write_queue.put((self.url_to_filename(url), text))
             return new_links
         except Exception as e:
             print(f"Error during {url}: {e}", file=sys.stderr)
@@ -161,52 +356,125 @@ class WikiScraper:
             return []
 
 
-async def worker(name, url_manager, scraper, session, semaphore):
+async def worker(name, url_manager, scraper, session, parse_queue):
     while True:
-        current_url = await url_manager.get_next_url()
+        current_url = await url_manager.wait_for_url()
         if current_url is None:
             print(f"Worker {name}: No more URLs to process.")
             break
 
-        async with semaphore:
-            new_links = await scraper.process_page(session, current_url)
-            if new_links:
-                added_count = await url_manager.add_new_urls(new_links)
-                if added_count > 0:
-                    print(f"Worker {name}: Found and added {added_count} new URLs to the queue.")
+        html = await scraper.fetch_page(session, current_url)
+        if html:
+            await parse_queue.put((html, current_url))
+        else:
+            url_manager.task_done()
 
-async def main():
-    start_time = asyncio.get_event_loop().time()
-    start_url = urljoin(BASE_URL, START_PATH)
+async def parser(name, url_manager, scraper, parse_queue):
+    while True:
+        item = await parse_queue.get()
+        if item is None:
+            break
 
-    url_manager = URLManager(start_url)
-    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
-        scraper = WikiScraper(BASE_URL, DUMP_DIR, USER_AGENT, executor)
-        await scraper.setup_robots_parser()
+        html, url = item
+        new_links = await scraper.process_page(html, url)
+        if new_links:
+            added_count = url_manager.add_new_urls(new_links)
+            if added_count > 0:
+                print(f"Parser {name}: Found and added {added_count} new URLs to the queue.")
+        url_manager.task_done()
+
+def write_archive_batch(archive, batch):
+    for filename, text in batch:
+        data = text.encode('utf-8')
+        info = tarfile.TarInfo(filename)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        archive.addfile(info, io.BytesIO(data))
+    archive.fileobj.flush()
+
+async def archive_writer(archive, write_queue):
+    loop = asyncio.get_running_loop()
+    finished = False
+    while not finished:
+        batch = [await write_queue.get()]
+        while len(batch) < ARCHIVE_BATCH_SIZE and not write_queue.empty():
+            batch.append(write_queue.get_nowait())
+        if batch[-1] is None:
+            finished = True
+            batch.pop()
+        if not batch:
+            continue
 
-        semaphore = asyncio.Semaphore(REQUEST_LIMIT)
-        
-        async with aiohttp.ClientSession() as session:
-            print(f"Starting {MAX_CONCURRENT_WORKERS} workers")
-            print(f"Text files are saved in: {os.path.abspath(DUMP_DIR)}")
-            print(f"Start URL: {start_url}")
+        try:
+            await loop.run_in_executor(None, write_archive_batch, archive, batch)
+            for filename, _ in batch:
+                print(f"Successfully saved text to: {filename}")
+        except (IOError, tarfile.TarError) as e:
+            print(f"Error writing {len(batch)} pages to {archive.name}: {e}", file=sys.stderr)
 
-            tasks = [
-                worker(f"Worker ID: {i+1}", url_manager, scraper, session, semaphore)
-                for i in range(MAX_CONCURRENT_WORKERS)
-            ]
+async def main(base_url, start_path):
+    start_time = asyncio.get_event_loop().time()
+    start_url = urljoin(base_url, start_path)
 
-            await asyncio.gather(*tasks)
+    # A fresh archive per run: appending would need the previous run to have
+    # closed its archive cleanly, and would re-add every page it already saved.
+    archive_path = os.path.join(DUMP_DIR, time.strftime(ARCHIVE_NAME_FORMAT))
+    url_manager = URLManager(start_url)
+    with ProcessPoolExecutor(max_workers=PARSER_COUNT) as executor:
+        scraper = WikiScraper(base_url, USER_AGENT, executor)
+
+        connector = aiohttp.TCPConnector(
+            limit=MAX_REQUEST_LIMIT * 4,
+            limit_per_host=MAX_REQUEST_LIMIT,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            resolver=aiohttp.AsyncResolver(),
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+        ) as session:
+            if not await scraper.setup_robots_parser(session):
+                return
+
+            with tarfile.open(archive_path, 'x') as archive:
+                print(f"Starting {MAX_CONCURRENT_WORKERS} workers and {PARSER_COUNT} parsers")
+                print(f"Text files are archived in: {os.path.abspath(archive_path)}")
+                print(f"Start URL: {start_url}")
+
+                writer_task = asyncio.create_task(archive_writer(archive, scraper.write_queue))
+                parse_queue = asyncio.Queue(maxsize=2 * PARSER_COUNT)
+                parsers = [
+                    asyncio.create_task(parser(f"ID: {i+1}", url_manager, scraper, parse_queue))
+                    for i in range(PARSER_COUNT)
+                ]
+                tasks = [
+                    worker(f"Worker ID: {i+1}", url_manager, scraper, session, parse_queue)
+                    for i in range(MAX_CONCURRENT_WORKERS)
+                ]
+
+                await asyncio.gather(*tasks)
+                for _ in parsers:
+                    await parse_queue.put(None)
+                await asyncio.gather(*parsers)
+                await scraper.write_queue.put(None)
+                await writer_task
 
     end_time = asyncio.get_event_loop().time()
     print("\n--- Crawling Finished ---")
     print(f"Total unique URLs visited: {url_manager.get_visited_count()}")
     print(f"Total execution time: {end_time - start_time:.2f} seconds")
-    print(f"Text files saved in: {os.path.abspath(DUMP_DIR)}")
+    print(f"Text files archived in: {os.path.abspath(archive_path)}")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     try:
-        asyncio.run(main())
+        print("Enter Starting URL such as https://rezero.fandom.com/wiki/World_Timeline\n\n")
+        user_input = input("Starting URL:" )
+        base_url = user_input.split("fandom.com")[0] + "fandom.com"
+        start_path = user_input.split("fandom.com")[1]
+        uvloop.run(main(base_url, start_path))
     except KeyboardInterrupt:
         print("Exit")
     except Exception as e: